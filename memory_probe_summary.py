@@ -1,49 +1,89 @@
 from __future__ import annotations
 
+import io
 import json
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+from ls_azure_night_runner.fileio import atomic_write_bytes
 
-def _read_jsonl(path: Path) -> List[Dict[str, object]]:
-    records: List[Dict[str, object]] = []
+_GROK_WORKER_NAMES = frozenset(("grok", ""))
+
+
+def _iter_jsonl(path: Path, needle: Optional[bytes] = None) -> Iterator[Dict[str, object]]:
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
+        with path.open("rb") as handle:
+            for raw in handle:
+                if not raw or raw == b"\n":
+                    continue
+                # Cheap substring reject before paying for a full JSON parse.
+                if needle is not None and needle not in raw:
+                    continue
+                line = raw.strip()
                 if not line:
                     continue
                 try:
+                    # json.loads accepts UTF-8 bytes directly; no separate decode pass.
                     obj = json.loads(line)
-                except json.JSONDecodeError:
+                except ValueError:
                     continue
                 if isinstance(obj, dict):
-                    records.append(obj)
+                    yield obj
     except FileNotFoundError:
-        return []
+        return
     except Exception:
-        return []
-    return records
+        return
+
+
+def _first_text(payload: Dict[str, object], keys: Tuple[str, ...]) -> Optional[str]:
+    for key in keys:
+        value = payload.get(key)
+        if isinstance(value, str):
+            value = value.strip()
+            if value:
+                return value
+    return None
 
 
 def _extract_probe_answer(record: Dict[str, object]) -> Optional[str]:
-    worker_payload = record.get("worker") if isinstance(record, dict) else None
-    candidate_fields = [
-        record.get("content"),
-        record.get("message"),
-        worker_payload.get("message") if isinstance(worker_payload, dict) else None,
-        worker_payload.get("patch") if isinstance(worker_payload, dict) else None,
-        worker_payload.get("error_message") if isinstance(worker_payload, dict) else None,
-    ]
-    for value in candidate_fields:
-        if isinstance(value, str) and value.strip():
-            return value.strip()
+    answer = _first_text(record, ("content", "message"))
+    if answer is not None:
+        return answer
+    worker_payload = record.get("worker")
+    if isinstance(worker_payload, dict):
+        return _first_text(worker_payload, ("message", "patch", "error_message"))
     return None
 
 
-def write_memory_probe_summary(run_dir: Path, mission_id: str = "NM-910") -> Optional[Path]:
+def _iter_run_dir_records(run_dir: Path, mission_id: str) -> Iterator[Dict[str, object]]:
+    needle = json.dumps(mission_id).encode("utf-8")
+    try:
+        with os.scandir(run_dir) as entries:
+            result_paths = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith("worker_results_")
+                and entry.name.endswith(".jsonl")
+                and entry.is_file(follow_symlinks=False)
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+    for path in result_paths:
+        yield from _iter_jsonl(path, needle)
+
+
+def write_memory_probe_summary(
+    run_dir: Path,
+    mission_id: str = "NM-910",
+    records: Optional[Iterable[Dict[str, object]]] = None,
+) -> Optional[Path]:
     """
     Collect Grok responses for NM-910 and write a markdown probe summary.
+
+    When ``records`` is given (worker result records already in memory), they are
+    used instead of re-reading ``worker_results_*.jsonl`` from ``run_dir``.
     """
 
     execution_name = run_dir.name
@@ -51,47 +91,41 @@ def write_memory_probe_summary(run_dir: Path, mission_id: str = "NM-910") -> Opt
     probe_unavailable = False
     missing_credentials: List[str] = []
 
-    for path in run_dir.glob("worker_results_*.jsonl"):
-        for record in _read_jsonl(path):
-            if record.get("mission_id") != mission_id:
-                continue
-            worker_name = (record.get("worker_name") or "").lower()
-            nested_worker = record.get("worker") if isinstance(record.get("worker"), dict) else {}
-            nested_worker_name = (nested_worker.get("worker_name") or "").lower() if nested_worker else ""
-            if worker_name not in {"grok", ""} and nested_worker_name != "grok":
-                continue
-            metadata = nested_worker.get("metadata") if isinstance(nested_worker, dict) else {}
-            if isinstance(metadata, dict) and metadata.get("probe_unavailable"):
-                probe_unavailable = True
-                creds = metadata.get("missing_credentials")
-                if isinstance(creds, list):
-                    missing_credentials = [str(c) for c in creds if str(c)]
-            answer = _extract_probe_answer(record)
-            if answer:
-                answers.append(answer)
+    if records is None:
+        records = _iter_run_dir_records(run_dir, mission_id)
+
+    for record in records:
+        if not isinstance(record, dict) or record.get("mission_id") != mission_id:
+            continue
+        worker_name = (record.get("worker_name") or "").lower()
+        nested_worker = record.get("worker")
+        if not isinstance(nested_worker, dict):
+            nested_worker = {}
+        nested_worker_name = (nested_worker.get("worker_name") or "").lower()
+        if worker_name not in _GROK_WORKER_NAMES and nested_worker_name != "grok":
+            continue
+        metadata = nested_worker.get("metadata")
+        if isinstance(metadata, dict) and metadata.get("probe_unavailable"):
+            probe_unavailable = True
+            creds = metadata.get("missing_credentials")
+            if isinstance(creds, list):
+                missing_credentials = [str(c) for c in creds if str(c)]
+        answer = _extract_probe_answer(record)
+        if answer:
+            answers.append(answer)
 
     if not answers and not probe_unavailable:
         return None
 
-    lines = [
-        f"# Memory Probe – {execution_name}",
-        "",
-        f"Mission: {mission_id}",
-        "",
-        "## Probe responses",
-        "",
-    ]
+    buffer = io.StringIO()
+    buffer.write(f"# Memory Probe – {execution_name}\n\nMission: {mission_id}\n\n## Probe responses\n")
     if probe_unavailable:
-        lines.extend(
-            [
-                "probe_unavailable: true",
-                f"missing_credentials: {', '.join(missing_credentials) if missing_credentials else 'unknown'}",
-                "",
-            ]
-        )
+        buffer.write("\nprobe_unavailable: true\n")
+        buffer.write(f"missing_credentials: {', '.join(missing_credentials) or 'unknown'}\n")
     if answers:
-        lines.append("\n\n".join(answers))
+        buffer.write("\n")
+        buffer.write("\n\n".join(answers))
 
     output_path = run_dir / f"memory_probe_{execution_name}.md"
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    atomic_write_bytes(output_path, buffer.getvalue().encode("utf-8"))
     return output_path
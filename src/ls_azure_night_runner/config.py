@@ -7,6 +7,15 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
+_TRUE_VALUES = frozenset(("1", "true", "yes", "on"))
+
+
+def env_flag(name: str) -> bool:
+    """Return True when the env var is set to 1/true/yes/on (case-insensitive, whitespace ignored)."""
+
+    return os.getenv(name, "").strip().lower() in _TRUE_VALUES
+
+
 @dataclass
 class PlannerConfig:
     """Minimal configuration for the dry-run planner."""
@@ -0,0 +1,76 @@
+"""Line-atomic stdout for code that prints from several threads at once."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Iterator, TextIO
+
+
+class _LineAtomicWriter:
+    """
+    Buffer each thread's writes and emit only whole lines, one writer at a time.
+
+    ``print()`` writes the text and the newline separately, so line-based log
+    records (e.g. ``WORKER_RESULT_JSON:``) from concurrent threads could otherwise
+    be fused onto one line before ``cycle.py`` parses them.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def write(self, text: str) -> int:
+        pending = getattr(self._local, "pending", "") + text
+        head, newline, tail = pending.rpartition("\n")
+        self._local.pending = tail
+        if newline:
+            with self._lock:
+                self._stream.write(head + newline)
+                self._stream.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        # A partial line stays buffered until its newline (or drain) arrives.
+        with self._lock:
+            self._stream.flush()
+
+    def drain(self) -> None:
+        """Emit whatever partial line the calling thread still has buffered."""
+
+        pending = getattr(self._local, "pending", "")
+        if pending:
+            self._local.pending = ""
+            with self._lock:
+                self._stream.write(pending)
+                self._stream.flush()
+
+    def __getattr__(self, name: str):
+        return getattr(self._stream, name)
+
+
+@contextmanager
+def line_atomic_stdout() -> Iterator[None]:
+    """Route ``sys.stdout`` through a line-atomic writer; nested use is a no-op."""
+
+    if isinstance(sys.stdout, _LineAtomicWriter):
+        yield
+        return
+    original = sys.stdout
+    writer = _LineAtomicWriter(original)
+    sys.stdout = writer
+    try:
+        yield
+    finally:
+        writer.drain()
+        sys.stdout = original
+
+
+def drain_stdout() -> None:
+    """Flush the calling thread's buffered partial line, if stdout is line-atomic."""
+
+    stream = sys.stdout
+    if isinstance(stream, _LineAtomicWriter):
+        stream.drain()
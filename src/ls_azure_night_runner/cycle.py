@@ -6,32 +6,36 @@ import argparse
 import contextlib
 import io
 import json
+import mmap
 import os
+import re
+import shutil
 import subprocess
 import sys
-from datetime import datetime
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from .dispatcher import run_nm_910_memory_probe
-from .secrets_bootstrap import log_night_runner_secret_status
+from .config import env_flag
+from .fileio import atomic_write_bytes, latest_execution_dir
 from .results import make_run_id
-from grok_rag_ingest import ingest_execution
-from memory_probe_summary import write_memory_probe_summary
-from run_memory_summary import write_run_memory_summary
-from worker_memory_summary import write_worker_memory_summary
-from worker_results import (
-    extract_worker_result_records_from_lines,
-    write_worker_results_jsonl,
-)
 
 
 MISSION_RESULT_PREFIX = "MISSION_RESULT_JSON:"
-
-
-def _env_flag(name: str) -> bool:
-    value = os.getenv(name, "")
-    return value.lower() in {"1", "true", "yes", "on"}
+_EPOCH_MIN = datetime.min.replace(tzinfo=timezone.utc)
+# Lines end at \n, \r or \r\n (universal newlines); leading whitespace is skipped
+# like str.strip() did, and the payload runs to the end of the line.
+_MISSION_RESULT_PATTERN = re.compile(
+    rb"(?:^|(?<=\r))[^\S\r\n]*"
+    + re.escape(MISSION_RESULT_PREFIX.encode("ascii"))
+    + rb"([^\r\n]*)",
+    re.MULTILINE,
+)
+_MISSION_ID_KEYS = ("mission", "mission_id", "id")
+_DETAIL_KEYS = ("reason", "message", "details")
 
 
 def parse_args() -> argparse.Namespace:
@@ -82,6 +86,7 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+@lru_cache(maxsize=1)
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
@@ -133,7 +138,10 @@ def run_cycle_job(
     subprocess.run(cmd, check=True)
 
 
-def list_job_executions(resource_group: str, job_name: str) -> List[Dict[str, Any]]:
+def latest_execution_name(resource_group: str, job_name: str) -> str:
+    # Project down to name/startTime so only those fields cross the pipe, but pick the
+    # newest in Python: az's sort_by compares startTime as strings, which misorders
+    # timestamps with differing fractional precision or UTC offsets.
     cmd = [
         "az",
         "containerapp",
@@ -144,30 +152,25 @@ def list_job_executions(resource_group: str, job_name: str) -> List[Dict[str, An
         job_name,
         "--resource-group",
         resource_group,
+        "--query",
+        "[].{name: name, startTime: properties.startTime}",
         "-o",
         "json",
     ]
     completed = run_subprocess(cmd)
-    data = json.loads(completed.stdout or "[]")
-    if not isinstance(data, list):
-        raise SystemExit("Unexpected response from az ... execution list")
-    return data
-
-
-def latest_execution_name(resource_group: str, job_name: str) -> str:
-    executions = list_job_executions(resource_group, job_name)
+    executions = json.loads(completed.stdout or "[]") or []
     if not executions:
         raise SystemExit("No executions found for job.")
 
     def parse_start(item: Dict[str, Any]) -> datetime:
-        start = item.get("properties", {}).get("startTime")
+        start = item.get("startTime")
         if not start:
-            return datetime.min
-        clean = start.replace("Z", "+00:00")
+            return _EPOCH_MIN
         try:
-            return datetime.fromisoformat(clean)
+            parsed = datetime.fromisoformat(start.replace("Z", "+00:00"))
         except ValueError:
-            return datetime.min
+            return _EPOCH_MIN
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
 
     latest = max(executions, key=parse_start)
     execution_name = latest.get("name")
@@ -176,13 +179,13 @@ def latest_execution_name(resource_group: str, job_name: str) -> str:
     return execution_name
 
 
-def fetch_logs(
+def _logs_command(
     resource_group: str,
     job_name: str,
     execution_name: str,
     max_lines: int,
-) -> str:
-    cmd = [
+) -> List[str]:
+    return [
         "az",
         "containerapp",
         "job",
@@ -199,8 +202,28 @@ def fetch_logs(
         "--tail",
         str(max_lines),
     ]
-    completed = run_subprocess(cmd)
-    return completed.stdout or ""
+
+
+def fetch_logs_to(
+    path: Path,
+    resource_group: str,
+    job_name: str,
+    execution_name: str,
+    max_lines: int,
+) -> tuple[int, str]:
+    """Stream job logs straight into path; return (exit code, stderr text)."""
+
+    cmd = _logs_command(resource_group, job_name, execution_name, max_lines)
+    print(f"$ {' '.join(cmd)}")
+    # stderr goes to a temp file so a chatty az cannot fill its pipe and stall stdout.
+    with path.open("wb") as fh, tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err)
+        with proc.stdout:
+            shutil.copyfileobj(proc.stdout, fh, length=1024 * 1024)
+        proc.wait()
+        err.seek(0)
+        stderr = err.read()
+    return proc.returncode, stderr.decode("utf-8", errors="replace")
 
 
 def fetch_execution_metadata(
@@ -226,12 +249,13 @@ def fetch_execution_metadata(
     return json.loads(payload)
 
 
-def ensure_run_dir(execution_name: str) -> Path:
-    return ensure_run_dir_at(repo_root(), execution_name)
+def ensure_run_dir(execution_name: str, today: Optional[str] = None) -> Path:
+    return ensure_run_dir_at(repo_root(), execution_name, today)
 
 
-def ensure_run_dir_at(base: Path, execution_name: str) -> Path:
-    today = datetime.now().strftime("%Y-%m-%d")
+def ensure_run_dir_at(base: Path, execution_name: str, today: Optional[str] = None) -> Path:
+    if today is None:
+        today = datetime.now().strftime("%Y-%m-%d")
     run_dir = base / "runs" / today / execution_name
     run_dir.mkdir(parents=True, exist_ok=True)
     return run_dir
@@ -258,50 +282,60 @@ def resolve_execution_dir(base: Path, override: Optional[str] = None) -> tuple[P
     if not runs_root.exists():
         raise SystemExit("No runs/ directory found for local cycle.")
 
-    date_dirs = sorted([d for d in runs_root.iterdir() if d.is_dir()], reverse=True)
-    for date_dir in date_dirs:
-        exec_dirs = sorted([d for d in date_dir.iterdir() if d.is_dir()], reverse=True)
-        if exec_dirs:
-            return exec_dirs[0], exec_dirs[0].name
+    exec_dir = latest_execution_dir(runs_root)
+    if exec_dir is not None:
+        return exec_dir, exec_dir.name
 
     raise SystemExit("No execution directories found under runs/.")
 
 
+def _size_or_missing(path: Path) -> int:
+    """Return the file size, or -1 when it does not exist (one stat call)."""
+
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return -1
+
+
 def write_text(path: Path, content: str) -> None:
-    path.write_text(content, encoding="utf-8")
+    atomic_write_bytes(path, content.encode("utf-8"))
 
 
 def write_json(path: Path, data: Dict[str, Any]) -> None:
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    atomic_write_bytes(path, json.dumps(data, indent=2).encode("utf-8"))
 
 
 def parse_mission_results(log_path: Path) -> List[Dict[str, Any]]:
     results: List[Dict[str, Any]] = []
-    if not log_path.exists():
+    try:
+        if log_path.stat().st_size == 0:
+            return results
+    except FileNotFoundError:
         return results
-    with log_path.open("r", encoding="utf-8") as fh:
-        for raw in fh:
-            line = raw.strip()
-            if not line.startswith(MISSION_RESULT_PREFIX):
-                continue
-            payload = line[len(MISSION_RESULT_PREFIX) :].strip()
+    with log_path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for match in _MISSION_RESULT_PATTERN.finditer(mm):
+            payload = match.group(1).strip()
             if not payload:
                 continue
             try:
                 results.append(json.loads(payload))
-            except json.JSONDecodeError as exc:
+            except ValueError as exc:
                 print(f"Warning: failed to parse mission result JSON: {exc}")
     return results
 
 
-def write_results_jsonl(path: Path, results: List[Dict[str, Any]]) -> None:
-    with path.open("w", encoding="utf-8") as fh:
-        for result in results:
-            fh.write(json.dumps(result) + "\n")
+def write_results_jsonl(path: Path, results: List[Dict[str, Any]]) -> int:
+    """Write results as JSONL and return the number of bytes written."""
+
+    payload = "".join([json.dumps(result) + "\n" for result in results])
+    path.write_text(payload, encoding="utf-8")
+    # json.dumps escapes non-ASCII by default, so characters == bytes.
+    return len(payload)
 
 
-def generate_night_report(results_path: Path, report_path: Path) -> None:
-    if not results_path.exists() or results_path.stat().st_size == 0:
+def generate_night_report(results_path: Path, report_path: Path, has_data: bool) -> None:
+    if not has_data:
         print("No mission results to report; skipping night_report.")
         return
     cmd = [
@@ -319,18 +353,13 @@ def generate_night_report(results_path: Path, report_path: Path) -> None:
 def summarize_missions(results: List[Dict[str, Any]]) -> List[str]:
     summaries: List[str] = []
     for result in results:
-        mission_id = (
-            result.get("mission")
-            or result.get("mission_id")
-            or result.get("id")
-            or "unknown-mission"
+        mission_id = next(
+            (result[key] for key in _MISSION_ID_KEYS if result.get(key)),
+            "unknown-mission",
         )
-        success = result.get("success")
-        detail = result.get("reason") or result.get("message") or result.get("details")
-        line = f"- {mission_id}: success={success}"
-        if detail:
-            line += f" ({detail})"
-        summaries.append(line)
+        detail = next((result[key] for key in _DETAIL_KEYS if result.get(key)), None)
+        suffix = f" ({detail})" if detail else ""
+        summaries.append(f"- {mission_id}: success={result.get('success')}{suffix}")
     if not summaries:
         summaries.append("- (no mission results found)")
     return summaries
@@ -339,6 +368,10 @@ def summarize_missions(results: List[Dict[str, Any]]) -> List[str]:
 def run_nm910_locally(repo_root_path: Path, run_dir: Path) -> str:
     """Run NM-910 locally and capture worker result logs."""
 
+    # Imported lazily: the dispatcher pulls in the Grok worker stack.
+    from .dispatcher import run_nm_910_memory_probe
+    from .secrets_bootstrap import log_night_runner_secret_status
+
     os.environ["LS_EXECUTION_DIR"] = str(run_dir)
     branch_name = os.getenv("LS_BRANCH_NAME") or "local-cycle"
     mission = {"mission_id": "NM-910", "repos": [{"name": repo_root_path.name}]}
@@ -356,12 +389,24 @@ def process_cycle_artifacts(
     logs_text: Optional[str],
     execution: Optional[Dict[str, Any]],
 ) -> Dict[str, Any]:
+    # Imported lazily so `--help` and argument errors do not pay for the artifact stack.
+    from grok_rag_ingest import ingest_execution
+    from memory_probe_summary import write_memory_probe_summary
+    from run_memory_summary import write_run_memory_summary
+    from worker_memory_summary import write_worker_memory_summary
+    from worker_results import (
+        extract_worker_result_records_from_lines,
+        write_worker_results_jsonl,
+    )
+
     logs_path = run_dir / f"logs_{execution_name}.txt"
-    if logs_text is None and logs_path.exists():
-        logs_text = logs_path.read_text(encoding="utf-8")
-    if logs_text is None:
+    # logs_text=None means the logs are already on disk (streamed from az or a
+    # previous run); they are then scanned from the file, never loaded whole.
+    if logs_text is not None:
+        write_text(logs_path, logs_text)
+    elif not logs_path.exists():
         logs_text = ""
-    write_text(logs_path, logs_text)
+        write_text(logs_path, logs_text)
     print(f"[cycle] Logs written to: {logs_path}")
 
     exec_path = run_dir / f"exec_{execution_name}.json"
@@ -378,11 +423,17 @@ def process_cycle_artifacts(
 
     mission_results = parse_mission_results(logs_path)
     mission_results_path = run_dir / f"mission_results_{execution_name}.jsonl"
-    write_results_jsonl(mission_results_path, mission_results)
+    results_bytes = write_results_jsonl(mission_results_path, mission_results)
     print(f"[cycle] Mission results JSONL: {mission_results_path}")
 
     worker_results_path: Optional[Path] = run_dir / f"worker_results_{execution_name}.jsonl"
-    worker_records = extract_worker_result_records_from_lines(logs_text.splitlines())
+    if logs_text is not None:
+        worker_records = extract_worker_result_records_from_lines(logs_text.splitlines())
+    else:
+        with logs_path.open("r", encoding="utf-8") as fh:
+            worker_records = extract_worker_result_records_from_lines(
+                line.rstrip("\n") for line in fh
+            )
     if worker_records:
         write_worker_results_jsonl(worker_records, worker_results_path)
         print(f"[cycle] Worker results JSONL: {worker_results_path}")
@@ -391,17 +442,18 @@ def process_cycle_artifacts(
         print("[cycle] Worker results JSONL: (not generated)")
 
     report_path = run_dir / f"night_report_{execution_name}.md"
-    generate_night_report(mission_results_path, report_path)
+    generate_night_report(mission_results_path, report_path, results_bytes > 0)
     summary_path = write_run_memory_summary(run_dir)
     worker_summary_path = write_worker_memory_summary(run_dir)
-    probe_summary_path = write_memory_probe_summary(run_dir)
+    # Reuse the freshly extracted records rather than re-parsing the JSONL just written.
+    probe_summary_path = write_memory_probe_summary(run_dir, records=worker_records or None)
     print(f"[cycle] Run memory summary: {summary_path}")
     print(f"[cycle] Worker memory summary (grok): {worker_summary_path}")
     if probe_summary_path:
         print(f"[cycle] Memory probe summary: {probe_summary_path}")
     else:
         print("[cycle] Memory probe summary: (not generated)")
-    if report_path.exists() and report_path.stat().st_size > 0:
+    if _size_or_missing(report_path) > 0:
         print(f"[cycle] Night report: {report_path}")
     else:
         print("[cycle] Night report: (not generated)")
@@ -442,7 +494,7 @@ def print_cycle_summary(data: Dict[str, Any]) -> None:
     print(f"  - Exec JSON: {data['exec_path']}")
     print(f"  - Mission results: {data['mission_results_path']}")
     worker_results_path = data.get("worker_results_path")
-    if worker_results_path and Path(worker_results_path).exists():
+    if worker_results_path and _size_or_missing(Path(worker_results_path)) >= 0:
         print(f"  - Worker results: {worker_results_path}")
     else:
         print("  - Worker results: (not generated)")
@@ -454,7 +506,7 @@ def print_cycle_summary(data: Dict[str, Any]) -> None:
     else:
         print("  - Memory probe summary: (not generated)")
     report_path = data.get("report_path")
-    if report_path and Path(report_path).exists() and Path(report_path).stat().st_size > 0:
+    if report_path and _size_or_missing(Path(report_path)) > 0:
         print(f"  - Night report: {report_path}")
     else:
         print("  - Night report: (not generated)")
@@ -462,6 +514,7 @@ def print_cycle_summary(data: Dict[str, Any]) -> None:
 
 def main() -> None:
     args = parse_args()
+    today = datetime.now().strftime("%Y-%m-%d")
     if args.run_local_nm910 or args.local_cycle:
         repo_root_path = Path(args.repo_root).resolve()
         local_execution_name: Optional[str] = None
@@ -469,7 +522,7 @@ def main() -> None:
 
         if args.run_local_nm910:
             local_execution_name = make_run_id()
-            run_dir = ensure_run_dir_at(repo_root_path, local_execution_name)
+            run_dir = ensure_run_dir_at(repo_root_path, local_execution_name, today)
             logs_text = run_nm910_locally(repo_root_path, run_dir)
             execution = {"name": local_execution_name, "properties": {"status": "local"}}
         else:
@@ -488,25 +541,39 @@ def main() -> None:
 
     run_id = make_run_id()
     print(f"Starting Night Runner cycle (run_id={run_id})...")
-    skip_build = args.skip_build or _env_flag("LS_NIGHT_SKIP_BUILD")
+    skip_build = args.skip_build or env_flag("LS_NIGHT_SKIP_BUILD")
     run_cycle_job(args.resource_group, args.job_name, args.image_tag, skip_build)
 
     execution_name = latest_execution_name(args.resource_group, args.job_name)
     print(f"Latest execution detected: {execution_name}")
-    run_dir = ensure_run_dir(execution_name)
+    run_dir = ensure_run_dir(execution_name, today)
 
-    logs_text = fetch_logs(
-        args.resource_group,
-        args.job_name,
-        execution_name,
-        args.max_log_lines,
-    )
-    execution = fetch_execution_metadata(args.resource_group, args.job_name, execution_name)
+    # Logs and execution metadata are independent az round-trips; fetch both at once.
+    # Logs stream straight to disk instead of being buffered in memory.
+    logs_path = run_dir / f"logs_{execution_name}.txt"
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        logs_future = pool.submit(
+            fetch_logs_to,
+            logs_path,
+            args.resource_group,
+            args.job_name,
+            execution_name,
+            args.max_log_lines,
+        )
+        execution_future = pool.submit(
+            fetch_execution_metadata, args.resource_group, args.job_name, execution_name
+        )
+        logs_returncode, logs_stderr = logs_future.result()
+        execution = execution_future.result()
+    if logs_returncode != 0:
+        if logs_stderr:
+            print(logs_stderr)
+        raise SystemExit(logs_returncode)
 
     result = process_cycle_artifacts(
         run_dir,
         execution_name,
-        logs_text,
+        None,
         execution,
     )
     print_cycle_summary(result)
@@ -5,8 +5,11 @@ from __future__ import annotations
 import csv
 import json
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
 
 from .executors.nm_010_backend_readme import run_nm_010
 from .executors.nm_011_scheduler_readme import run_nm_011
@@ -16,6 +19,9 @@ from .executors.nm_901_grok_api import run_nm_901
 from .executors.nm_902_grok_review import run_nm_902
 from .executors.nm_903_grok_apply import run_nm_903
 from .executors.nm_904_grok_pr import run_nm_904
+from .config import env_flag
+from .console import drain_stdout, line_atomic_stdout
+from .fileio import latest_execution_dir
 from .git_sandbox import branch_name_for_mission
 from grok_worker import GrokWorker, GrokWorkerConfig
 from worker_logging import print_worker_result_log_record
@@ -37,6 +43,7 @@ def _grok_credentials_from_env() -> Dict[str, object]:
     }
 
 
+@lru_cache(maxsize=8)
 def _resolve_repo_path(provided_repo_root: Path) -> Path:
     """Use provided repo path when it looks valid, else fall back to local source checkout."""
 
@@ -45,66 +52,174 @@ def _resolve_repo_path(provided_repo_root: Path) -> Path:
     return Path(__file__).resolve().parents[3]
 
 
-def _resolve_execution_dir(repo_path: Path) -> Optional[Tuple[Path, str]]:
+# repo path -> (run dir, execution name); owned by the caller for one Night Runner run.
+ExecutionDirs = Dict[Path, Tuple[Path, str]]
+
+
+def _resolve_execution_dir(
+    repo_path: Path, execution_dirs: Optional[ExecutionDirs] = None
+) -> Optional[Tuple[Path, str]]:
+    """
+    Resolve the execution run dir for a repo (LS_EXECUTION_DIR, else newest under runs/).
+
+    When the caller passes its per-run ``execution_dirs`` memo, each repo is resolved
+    once per run; misses are not remembered, so a run dir created later is still found.
+    """
+
+    if execution_dirs is not None:
+        cached = execution_dirs.get(repo_path)
+        if cached is not None:
+            return cached
+
+    exec_info: Optional[Tuple[Path, str]] = None
     env_dir = os.getenv("LS_EXECUTION_DIR")
     if env_dir:
         path = Path(env_dir)
         if not path.is_absolute():
             path = repo_path / path
         if path.is_dir():
-            return path, path.name
-    runs_root = repo_path / "runs"
-    if not runs_root.exists():
-        return None
-    date_dirs = sorted([d for d in runs_root.iterdir() if d.is_dir()], reverse=True)
-    for date_dir in date_dirs:
-        exec_dirs = sorted([d for d in date_dir.iterdir() if d.is_dir()], reverse=True)
-        if exec_dirs:
-            return exec_dirs[0], exec_dirs[0].name
-    return None
-
-
-def _load_snapshot_records(snapshot_dir: Path) -> list[dict]:
+            exec_info = (path, path.name)
+    if exec_info is None:
+        latest = latest_execution_dir(repo_path / "runs")
+        if latest is not None:
+            exec_info = (latest, latest.name)
+
+    if exec_info is not None and execution_dirs is not None:
+        execution_dirs[repo_path] = exec_info
+    return exec_info
+
+
+def _load_snapshot_records(snapshot_dir: Path) -> Iterator[dict]:
     """
-    Load snapshot records from a directory.
+    Yield snapshot records from a directory, one file at a time.
 
     Supports:
     - *.csv files parsed with csv.DictReader
     - *.json files containing either a list[dict] or an object with a "rows" list.
     """
-    records: list[dict] = []
-    if not snapshot_dir.exists() or not snapshot_dir.is_dir():
-        return records
+    if not snapshot_dir.is_dir():
+        return
 
-    for path in sorted(snapshot_dir.iterdir()):
-        if not path.is_file():
-            continue
+    with os.scandir(snapshot_dir) as it:
+        entries = sorted((e for e in it if e.is_file()), key=lambda e: e.name)
+
+    for entry in entries:
+        path = Path(entry.path)
         suffix = path.suffix.lower()
         try:
             if suffix == ".csv":
-                with path.open("r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        if isinstance(row, dict):
-                            records.append(row)
+                with path.open("r", encoding="utf-8", newline="") as f:
+                    yield from csv.DictReader(f)
             elif suffix == ".json":
-                with path.open("r", encoding="utf-8") as f:
+                with path.open("rb") as f:
                     data = json.load(f)
+                if isinstance(data, dict):
+                    data = data.get("rows")
                 if isinstance(data, list):
                     for item in data:
                         if isinstance(item, dict):
-                            records.append(item)
-                elif isinstance(data, dict):
-                    rows = data.get("rows")
-                    if isinstance(rows, list):
-                        for item in rows:
-                            if isinstance(item, dict):
-                                records.append(item)
+                            yield item
         except Exception:
             # Tolerate bad files; skip on error.
             continue
 
-    return records
+
+# Built once: json.dumps with non-default options constructs a new encoder per call.
+_SUMMARY_ENCODER = json.JSONEncoder(ensure_ascii=False)
+_SUMMARY_ENCODER_INDENTED = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def _write_summary_json(output_path: Path, summary: Dict[str, object]) -> None:
+    """
+    Write a mission summary as UTF-8 JSON straight to the file descriptor.
+
+    Output is compact unless LS_NIGHT_DEBUG_JSON is set, in which case it is indented.
+    """
+    encoder = _SUMMARY_ENCODER_INDENTED if env_flag("LS_NIGHT_DEBUG_JSON") else _SUMMARY_ENCODER
+    data = memoryview(encoder.encode(summary).encode("utf-8"))
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            written = os.write(fd, data)
+            data = data[written:]
+    finally:
+        os.close(fd)
+
+
+_SUCCESS_OUTCOMES = frozenset({"success", "resolved"})
+_FAILURE_OUTCOMES = frozenset({"failed", "retreat_required", "retreat", "repeat"})
+
+
+def _label(value: object, default: str = "unknown") -> str:
+    """Coalesce a snapshot field to a stripped string, falling back to default when blank."""
+
+    if not value:
+        return default
+    text = value.strip() if isinstance(value, str) else str(value).strip()
+    return text or default
+
+
+def _summarize_profit_cohorts(records: Iterable[dict]) -> list[Dict[str, object]]:
+    """Fold profit snapshot rows into per-cohort revenue/cost/margin totals in one pass."""
+
+    # cohort -> [revenue, direct_cost]
+    cohorts: Dict[str, list[float]] = defaultdict(lambda: [0.0, 0.0])
+    for rec in records:
+        cohort = _label(rec.get("cohort"))
+        revenue_raw = rec.get("revenue", 0)
+        cost_raw = rec.get("direct_cost", 0)
+        try:
+            revenue = float(revenue_raw)
+        except Exception:
+            revenue = 0.0
+        try:
+            direct_cost = float(cost_raw)
+        except Exception:
+            direct_cost = 0.0
+
+        agg = cohorts[cohort]
+        agg[0] += revenue
+        agg[1] += direct_cost
+
+    return [
+        {
+            "cohort": cohort,
+            "total_revenue": revenue,
+            "total_direct_cost": direct_cost,
+            "gross_margin": revenue - direct_cost,
+        }
+        for cohort, (revenue, direct_cost) in cohorts.items()
+    ]
+
+
+def _summarize_treatment_stats(records: Iterable[dict]) -> list[Dict[str, object]]:
+    """Fold treatment rows into per-(cohort, material) outcome counts in one pass."""
+
+    # (cohort, material) -> [total, success, failure]
+    stats: Dict[tuple, list[float]] = defaultdict(lambda: [0.0, 0.0, 0.0])
+    for rec in records:
+        cohort = _label(rec.get("cohort"))
+        material = _label(rec.get("material"))
+        outcome = _label(rec.get("outcome"), "").lower()
+
+        agg = stats[(cohort, material)]
+        agg[0] += 1.0
+        if outcome in _SUCCESS_OUTCOMES:
+            agg[1] += 1.0
+        elif outcome in _FAILURE_OUTCOMES:
+            agg[2] += 1.0
+
+    return [
+        {
+            "cohort": cohort,
+            "material": material,
+            "total_treatments": total,
+            "success_count": success,
+            "failure_count": failure,
+            "success_rate": (success / total) if total > 0 else 0.0,
+        }
+        for (cohort, material), (total, success, failure) in stats.items()
+    ]
 
 
 def run_nm_910_memory_probe(
@@ -256,261 +371,201 @@ def run_nm_910_memory_probe(
     }
 
 
-def run_nm_920_profit_snapshot(
-    repo_root: Path, mission: Dict[str, object], branch_name: str
+def _run_snapshot_summary(
+    repo_root: Path,
+    branch_name: str,
+    *,
+    mission_id: str,
+    snapshot_subdir: str,
+    output_prefix: str,
+    rows_key: str,
+    summarize: Callable[[Iterable[dict]], list[Dict[str, object]]],
+    summary_label: str,
+    snapshot_label: str,
+    execution_dirs: Optional[ExecutionDirs] = None,
 ) -> Dict[str, object]:
     """
-    Read profit snapshot files and write a cohort-level margin summary for NM-920.
+    Shared driver for read-only snapshot missions (NM-920, NM-930).
 
-    This mission is read-only with respect to repos and external systems.
-    It only writes a summary JSON file into the execution run directory.
+    Streams records from ``<repo>/<snapshot_subdir>`` through ``summarize`` and writes
+    the resulting rows to ``<output_prefix>_<execution>.json`` in the execution run dir.
     """
 
     repo_path = _resolve_repo_path(repo_root)
-    exec_info = _resolve_execution_dir(repo_path)
+    result: Dict[str, object] = {
+        "mission": mission_id,
+        "repo": str(repo_path.name),
+        "branch": branch_name,
+    }
+
+    exec_info = _resolve_execution_dir(repo_path, execution_dirs)
     if exec_info is None:
-        message = "NM-920: no execution directory found; skipping profit snapshot summary."
-        return {
-            "mission": "NM-920",
-            "repo": str(repo_path.name),
-            "branch": branch_name,
-            "success": False,
-            "message": message,
-        }
+        result["success"] = False
+        result["message"] = (
+            f"{mission_id}: no execution directory found; skipping {summary_label}."
+        )
+        return result
 
     run_dir, execution_name = exec_info
 
-    snapshot_dir = repo_path / "profit_snapshots"
-    records = _load_snapshot_records(snapshot_dir)
-    if not records:
-        message = "NM-920: no profit snapshots found; nothing to summarize."
-        return {
-            "mission": "NM-920",
-            "repo": str(repo_path.name),
-            "branch": branch_name,
-            "success": True,
-            "message": message,
-        }
-
-    cohorts: Dict[str, Dict[str, float]] = {}
-    for rec in records:
-        if not isinstance(rec, dict):
-            continue
-        cohort = str(rec.get("cohort") or "").strip() or "unknown"
-        revenue_raw = rec.get("revenue", 0)
-        cost_raw = rec.get("direct_cost", 0)
-        try:
-            revenue = float(revenue_raw)
-        except Exception:
-            revenue = 0.0
-        try:
-            direct_cost = float(cost_raw)
-        except Exception:
-            direct_cost = 0.0
-
-        agg = cohorts.setdefault(
-            cohort,
-            {"revenue": 0.0, "direct_cost": 0.0},
-        )
-        agg["revenue"] += revenue
-        agg["direct_cost"] += direct_cost
-
-    summary_cohorts: list[Dict[str, object]] = []
-    for cohort, agg in cohorts.items():
-        revenue = float(agg.get("revenue") or 0.0)
-        direct_cost = float(agg.get("direct_cost") or 0.0)
-        gross_margin = revenue - direct_cost
-        summary_cohorts.append(
-            {
-                "cohort": cohort,
-                "total_revenue": revenue,
-                "total_direct_cost": direct_cost,
-                "gross_margin": gross_margin,
-            }
-        )
+    rows = summarize(_load_snapshot_records(repo_path / snapshot_subdir))
+    if not rows:
+        result["success"] = True
+        result["message"] = f"{mission_id}: no {snapshot_label} found; nothing to summarize."
+        return result
 
     summary: Dict[str, object] = {
-        "mission_id": "NM-920",
+        "mission_id": mission_id,
         "execution": execution_name,
-        "cohorts": summary_cohorts,
+        rows_key: rows,
     }
 
-    output_name = f"profit_snapshot_{execution_name}.json"
+    output_name = f"{output_prefix}_{execution_name}.json"
     output_path = run_dir / output_name
     try:
-        output_path.write_text(
-            json.dumps(summary, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
-        message = f"NM-920: wrote profit snapshot summary to {output_name}."
+        _write_summary_json(output_path, summary)
+        message = f"{mission_id}: wrote {summary_label} to {output_name}."
         success = True
     except Exception as exc:
-        message = f"NM-920: failed to write profit snapshot summary: {exc}"
+        message = f"{mission_id}: failed to write {summary_label}: {exc}"
         success = False
 
-    return {
-        "mission": "NM-920",
-        "repo": str(repo_path.name),
-        "branch": branch_name,
-        "success": success,
-        "message": message,
-        "summary_file": str(output_path) if success else None,
-    }
+    result["success"] = success
+    result["message"] = message
+    result["summary_file"] = str(output_path) if success else None
+    return result
 
 
-def run_nm_930_treatment_summary(
-    repo_root: Path, mission: Dict[str, object], branch_name: str
+def run_nm_920_profit_snapshot(
+    repo_root: Path,
+    mission: Dict[str, object],
+    branch_name: str,
+    *,
+    execution_dirs: Optional[ExecutionDirs] = None,
 ) -> Dict[str, object]:
     """
-    Read treatment history snapshots and write a cohort-level efficacy summary for NM-930.
+    Read profit snapshot files and write a cohort-level margin summary for NM-920.
 
-    This mission is read-only and must not recommend or rely on heat treatments.
+    This mission is read-only with respect to repos and external systems.
+    It only writes a summary JSON file into the execution run directory.
     """
 
-    repo_path = _resolve_repo_path(repo_root)
-    exec_info = _resolve_execution_dir(repo_path)
-    if exec_info is None:
-        message = "NM-930: no execution directory found; skipping treatment summary."
-        return {
-            "mission": "NM-930",
-            "repo": str(repo_path.name),
-            "branch": branch_name,
-            "success": False,
-            "message": message,
-        }
+    return _run_snapshot_summary(
+        repo_root,
+        branch_name,
+        mission_id="NM-920",
+        snapshot_subdir="profit_snapshots",
+        output_prefix="profit_snapshot",
+        rows_key="cohorts",
+        summarize=_summarize_profit_cohorts,
+        summary_label="profit snapshot summary",
+        snapshot_label="profit snapshots",
+        execution_dirs=execution_dirs,
+    )
 
-    run_dir, execution_name = exec_info
 
-    snapshot_dir = repo_path / "treatment_history"
-    records = _load_snapshot_records(snapshot_dir)
-    if not records:
-        message = "NM-930: no treatment history snapshots found; nothing to summarize."
-        return {
-            "mission": "NM-930",
-            "repo": str(repo_path.name),
-            "branch": branch_name,
-            "success": True,
-            "message": message,
-        }
+def run_nm_930_treatment_summary(
+    repo_root: Path,
+    mission: Dict[str, object],
+    branch_name: str,
+    *,
+    execution_dirs: Optional[ExecutionDirs] = None,
+) -> Dict[str, object]:
+    """
+    Read treatment history snapshots and write a cohort-level efficacy summary for NM-930.
 
-    stats: Dict[tuple, Dict[str, float]] = {}
-    for rec in records:
-        if not isinstance(rec, dict):
-            continue
+    This mission is read-only and must not recommend or rely on heat treatments.
+    """
 
-        cohort = str(rec.get("cohort") or "").strip() or "unknown"
-        material = str(rec.get("material") or "").strip() or "unknown"
-        outcome = str(rec.get("outcome") or "").strip().lower()
+    return _run_snapshot_summary(
+        repo_root,
+        branch_name,
+        mission_id="NM-930",
+        snapshot_subdir="treatment_history",
+        output_prefix="treatment_snapshot",
+        rows_key="cohort_material_stats",
+        summarize=_summarize_treatment_stats,
+        summary_label="treatment summary",
+        snapshot_label="treatment history snapshots",
+        execution_dirs=execution_dirs,
+    )
 
-        if "heat" in material.lower():
-            pass
 
-        key = (cohort, material)
-        agg = stats.setdefault(
-            key,
-            {"total": 0.0, "success": 0.0, "failure": 0.0},
-        )
+EXECUTORS = {
+    "NM-010": run_nm_010,
+    "NM-011": run_nm_011,
+    "NM-020": run_nm_020,
+    "NM-900": run_nm_900,
+    "NM-901": run_nm_901,
+    "NM-902": run_nm_902,
+    "NM-903": run_nm_903,
+    "NM-904": run_nm_904,
+    "NM-910": run_nm_910_memory_probe,
+    "NM-920": run_nm_920_profit_snapshot,
+    "NM-930": run_nm_930_treatment_summary,
+}
 
-        agg["total"] += 1.0
-        if outcome in {"success", "resolved"}:
-            agg["success"] += 1.0
-        elif outcome in {"failed", "retreat_required", "retreat", "repeat"}:
-            agg["failure"] += 1.0
-
-    summary_rows: list[Dict[str, object]] = []
-    for (cohort, material), agg in stats.items():
-        total = float(agg.get("total") or 0.0)
-        success = float(agg.get("success") or 0.0)
-        failure = float(agg.get("failure") or 0.0)
-        success_rate = (success / total) if total > 0 else 0.0
-
-        summary_rows.append(
-            {
-                "cohort": cohort,
-                "material": material,
-                "total_treatments": total,
-                "success_count": success,
-                "failure_count": failure,
-                "success_rate": success_rate,
-            }
-        )
 
-    summary: Dict[str, object] = {
-        "mission_id": "NM-930",
-        "execution": execution_name,
-        "cohort_material_stats": summary_rows,
-    }
+# Executors that accept the per-run ``execution_dirs`` memo.
+_EXECUTION_DIR_MISSIONS = frozenset({"NM-920", "NM-930"})
 
-    output_name = f"treatment_snapshot_{execution_name}.json"
-    output_path = run_dir / output_name
-    try:
-        output_path.write_text(
-            json.dumps(summary, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
-        message = f"NM-930: wrote treatment summary to {output_name}."
-        success = True
-    except Exception as exc:
-        message = f"NM-930: failed to write treatment summary: {exc}"
-        success = False
 
-    return {
-        "mission": "NM-930",
-        "repo": str(repo_path.name),
-        "branch": branch_name,
-        "success": success,
-        "message": message,
-        "summary_file": str(output_path) if success else None,
-    }
+def get_executor(mission_id: str):
+    return EXECUTORS.get(mission_id)
 
 
-EXECUTORS = {
-    "NM-010": lambda repo_path, mission, branch: run_nm_010(repo_path, branch),
-    "NM-011": lambda repo_path, mission, branch: run_nm_011(repo_path, branch),
-    "NM-020": lambda repo_path, mission, branch: run_nm_020(repo_path, mission),
-    "NM-900": lambda repo_path, mission, branch: run_nm_900(repo_path, mission, branch),
-    "NM-901": lambda repo_path, mission, branch: run_nm_901(repo_path, mission, branch),
-    "NM-902": lambda repo_path, mission, branch: run_nm_902(repo_path, mission, branch),
-    "NM-903": lambda repo_path, mission, branch: run_nm_903(repo_path, mission, branch),
-    "NM-904": lambda repo_path, mission, branch: run_nm_904(repo_path, mission, branch),
-    "NM-910": lambda repo_path, mission, branch: run_nm_910_memory_probe(
-        repo_path, mission, branch
-    ),
-    "NM-920": lambda repo_path, mission, branch: run_nm_920_profit_snapshot(
-        repo_path, mission, branch
-    ),
-    "NM-930": lambda repo_path, mission, branch: run_nm_930_treatment_summary(
-        repo_path, mission, branch
-    ),
-}
+def mission_repo_names(mission: Dict[str, Any]) -> Tuple[str, ...]:
+    """Return the names of the repos a mission declares, in declaration order."""
 
+    repos = mission.get("repos") or []
+    if not isinstance(repos, list):
+        return ()
+    return tuple(
+        repo["name"] for repo in repos if isinstance(repo, dict) and repo.get("name")
+    )
 
-def get_executor(mission_id: str):
-    return EXECUTORS.get(mission_id)
 
+def run_mission_executor(
+    mission: Dict[str, Any],
+    repos_root: Path,
+    execution_dirs: Optional[ExecutionDirs] = None,
+):
+    """
+    Run the mission's executor against each of its repos.
+
+    ``execution_dirs`` is an optional per-run memo so missions sharing a repo
+    resolve its execution run dir only once per Night Runner run.
+    """
 
-def run_mission_executor(mission: Dict[str, Any], repos_root: Path):
     mission_id = mission.get("mission_id")
-    executor = get_executor(mission_id)
+    executor = EXECUTORS.get(mission_id)
     if executor is None:
         return {"mission": mission_id, "skipped": True, "reason": "no executor"}
+    if execution_dirs is not None and mission_id in _EXECUTION_DIR_MISSIONS:
+        executor = partial(executor, execution_dirs=execution_dirs)
 
     repos = mission.get("repos") or []
     if not isinstance(repos, list):
         return {"mission": mission_id, "skipped": True, "reason": "invalid repos"}
 
+    repo_names = mission_repo_names(mission)
+    if not repo_names:
+        return {"mission": mission_id, "skipped": True, "reason": "no valid repos"}
+
     branch = branch_name_for_mission(mission)
-    results = []
-    for repo in repos:
-        if not isinstance(repo, dict):
-            continue
-        repo_name = repo.get("name")
-        if not repo_name:
-            continue
-        repo_path = repos_root / repo_name
-        result = executor(repo_path, mission, branch)
-        results.append(result)
+    if len(repo_names) == 1:
+        return executor(repos_root / repo_names[0], mission, branch)
 
-    if not results:
-        return {"mission": mission_id, "skipped": True, "reason": "no valid repos"}
+    def _run(name: str):
+        try:
+            return executor(repos_root / name, mission, branch)
+        finally:
+            drain_stdout()
+
+    # Executors are git/network bound and each works in its own repo checkout,
+    # so per-repo runs can overlap safely; stdout is line-atomic so concurrent
+    # WORKER_RESULT_JSON records are never fused.
+    with line_atomic_stdout(), ThreadPoolExecutor(max_workers=min(8, len(repo_names))) as pool:
+        futures = [pool.submit(_run, name) for name in repo_names]
+        results = [future.result() for future in futures]
     return results[0]
@@ -24,7 +24,9 @@ def _run(cmd: list[str], cwd: Path) -> subprocess.CompletedProcess:
     return subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, check=False)
 
 
-def run_nm_010(repo_root: Path, branch_name: str) -> Dict[str, object]:
+def run_nm_010(
+    repo_root: Path, mission: Dict[str, object], branch_name: str
+) -> Dict[str, object]:
     result: Dict[str, object] = {
         "mission": "NM-010",
         "repo": "ls-backend",
@@ -60,16 +62,8 @@ def run_nm_010(repo_root: Path, branch_name: str) -> Dict[str, object]:
             fh.write("\n")
         fh.write("\n" + BLOCK + "\n")
 
-    status = _run(["git", "status", "--porcelain", "README.md"], cwd=repo_root)
-    if status.returncode != 0:
-        result["message"] = f"git status failed: {status.stderr.strip()}"
-        return result
-
-    if not status.stdout.strip():
-        result["success"] = True
-        result["message"] = "NM-010 README unchanged"
-        return result
-
+    # The marker was absent and the block was just appended, so README.md is
+    # known to be modified; no `git status` round-trip is needed before adding.
     add_run = _run(["git", "add", "README.md"], cwd=repo_root)
     if add_run.returncode != 0:
         result["message"] = f"git add failed: {add_run.stderr.strip()}"
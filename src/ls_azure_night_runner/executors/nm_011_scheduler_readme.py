@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
 from pathlib import Path
 from typing import Dict
@@ -17,6 +18,9 @@ BLOCK = (
     "- Every Night Runner change is small (capped files/LOC), validated in CI, "
     "reviewed/merged by humans, and auditable via Proof Chain entries and Night Reports.\n"
 )
+_BLOCK_BYTES = BLOCK.encode("utf-8")
+_MARKER_BYTES = b"## Night Runner (Autonomous Night Work)"
+_COMMIT_MSG = "NM-011: add Night Runner section to ls-scheduler README"
 
 
 def _run(cmd: list[str], cwd: Path) -> subprocess.CompletedProcess:
@@ -33,29 +37,36 @@ def sync_with_remote_sandbox(repo_root: Path, branch_name: str) -> tuple[bool, s
         else:
             return False, fetch.stderr.strip() or "git fetch failed"
 
-    checkout = _run(["git", "checkout", branch_name], cwd=repo_root)
-    if checkout.returncode != 0:
-        return False, checkout.stderr.strip() or "git checkout failed"
-
     if missing_remote:
+        checkout = _run(["git", "checkout", branch_name], cwd=repo_root)
+        if checkout.returncode != 0:
+            return False, checkout.stderr.strip() or "git checkout failed"
         return True, "no remote branch; using local sandbox"
 
-    reset = _run([
+    # Check out and hard-reset to the remote sandbox in one git invocation.
+    checkout = _run([
         "git",
-        "reset",
-        "--hard",
+        "checkout",
+        "-f",
+        "-B",
+        branch_name,
         f"origin/{branch_name}",
     ], cwd=repo_root)
-    if reset.returncode != 0:
-        err = reset.stderr.strip().lower()
-        if "unknown revision" in err or "not a valid object" in err:
+    if checkout.returncode != 0:
+        err = checkout.stderr.strip().lower()
+        if "invalid reference" in err or "not a commit" in err or "unknown revision" in err:
+            local = _run(["git", "checkout", branch_name], cwd=repo_root)
+            if local.returncode != 0:
+                return False, local.stderr.strip() or "git checkout failed"
             return True, "remote branch missing after fetch; using local only"
-        return False, reset.stderr.strip() or "git reset failed"
+        return False, checkout.stderr.strip() or "git checkout failed"
 
     return True, "synced with remote sandbox"
 
 
-def run_nm_011(repo_root: Path, branch_name: str) -> Dict[str, object]:
+def run_nm_011(
+    repo_root: Path, mission: Dict[str, object], branch_name: str
+) -> Dict[str, object]:
     result: Dict[str, object] = {
         "mission": "NM-011",
         "repo": "ls-scheduler",
@@ -80,34 +91,30 @@ def run_nm_011(repo_root: Path, branch_name: str) -> Dict[str, object]:
     if not readme_path.exists():
         readme_path.write_text("# ls-scheduler\n\n")
 
-    content = readme_path.read_text()
-    if "## Night Runner (Autonomous Night Work)" in content:
-        result["success"] = True
-        result["message"] = "NM-011 README already contains Night Runner section"
-        return result
-
-    with readme_path.open("a") as fh:
-        if not content.endswith("\n\n"):
-            fh.write("\n")
-        fh.write("\n" + BLOCK + "\n")
-
-    status = _run(["git", "status", "--porcelain", "README.md"], cwd=repo_root)
-    if status.returncode != 0:
-        result["message"] = f"git status failed: {status.stderr.strip()}"
-        return result
-
-    if not status.stdout.strip():
-        result["success"] = True
-        result["message"] = "NM-011 README unchanged"
-        return result
-
+    # Single open: search the raw bytes for the marker and append in place if absent.
+    fd = os.open(readme_path, os.O_RDWR)
+    try:
+        content = os.read(fd, os.fstat(fd).st_size)
+        if _MARKER_BYTES in content:
+            result["success"] = True
+            result["message"] = "NM-011 README already contains Night Runner section"
+            return result
+
+        os.lseek(fd, 0, os.SEEK_END)
+        separator = b"" if content.endswith(b"\n\n") else b"\n"
+        os.write(fd, separator + b"\n" + _BLOCK_BYTES + b"\n")
+    finally:
+        os.close(fd)
+
+    # The marker was absent and the block was just appended, so README.md is
+    # known to be modified; no `git status` round-trip is needed before adding.
     add_run = _run(["git", "add", "README.md"], cwd=repo_root)
     if add_run.returncode != 0:
         result["message"] = f"git add failed: {add_run.stderr.strip()}"
         return result
 
     commit_run = _run(
-        ["git", "commit", "-m", "NM-011: add Night Runner section to ls-scheduler README"],
+        ["git", "commit", "-m", _COMMIT_MSG],
         cwd=repo_root,
     )
     if commit_run.returncode != 0:
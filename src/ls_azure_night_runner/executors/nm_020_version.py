@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
+import py_compile
 import subprocess
 from pathlib import Path
-import sys
 from typing import Dict
 
-from ..git_sandbox import branch_name_for_mission
 from ..github_pr import create_pr
 
 Result = Dict[str, object]
@@ -32,9 +31,20 @@ def push_branch(repo_root: Path, branch_name: str) -> tuple[bool, str]:
     return True, f"pushed origin/{branch_name}"
 
 
-def run_nm_020(repo_root: Path, mission: Dict[str, object]) -> Result:
+def compile_package(package_dir: Path) -> list[str]:
+    """Byte-compile every module under package_dir and return any error messages."""
+
+    errors: list[str] = []
+    for source in sorted(package_dir.rglob("*.py")):
+        try:
+            py_compile.compile(str(source), doraise=True)
+        except py_compile.PyCompileError as exc:
+            errors.append(exc.msg.strip())
+    return errors
+
+
+def run_nm_020(repo_root: Path, mission: Dict[str, object], branch: str) -> Result:
     repo = "ls-backend"
-    branch = branch_name_for_mission(mission)
     result: Result = {
         "mission": mission.get("mission_id"),
         "repo": repo,
@@ -71,12 +81,12 @@ def run_nm_020(repo_root: Path, mission: Dict[str, object]) -> Result:
             'version = "0.1.0"\n'
         )
 
-    python_exec = Path(sys.executable)
-    cmd = [python_exec.as_posix(), "-m", "compileall", "."]
-    compile_run = _run(cmd, cwd=repo_root)
-    if compile_run.returncode != 0:
+    # Byte-compile only the package NM-020 touches, in-process (no second
+    # interpreter and no global stdout redirection, so it is thread-safe).
+    compile_errors = compile_package(package_dir)
+    if compile_errors:
         result["message"] = (
-            f"compileall failed: {compile_run.stderr.strip()}"
+            f"compile failed: {'; '.join(compile_errors)}"
         )
         return result
 
@@ -122,7 +132,7 @@ def run_nm_020(repo_root: Path, mission: Dict[str, object]) -> Result:
     pr_body = (
         "Night Runner Mission NM-020.\n\n"
         "- Adds ls_backend.version version constant for ls-backend.\n"
-        "- Runs compileall to validate.\n"
+        "- Byte-compiles the ls_backend package to validate.\n"
         f"- Sandbox branch: {branch}\n"
     )
     pr_result = create_pr(
@@ -0,0 +1,62 @@
+"""Filesystem helpers shared by the cycle driver, dispatcher and summaries."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Optional
+
+from .config import env_flag
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write via a sibling temp file and os.replace so readers never see a partial file.
+
+    The temp file is fsynced unless LS_NIGHT_SKIP_FSYNC is set, and removed if
+    the write fails.
+    """
+
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with tmp.open("wb") as fh:
+            fh.write(data)
+            if not env_flag("LS_NIGHT_SKIP_FSYNC"):
+                fh.flush()
+                os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def latest_subdir(parent: Path) -> Optional[Path]:
+    """Return the lexically greatest subdirectory of parent in one scandir pass."""
+
+    best: Optional[os.DirEntry] = None
+    with os.scandir(parent) as entries:
+        for entry in entries:
+            if entry.is_dir() and (best is None or entry.name > best.name):
+                best = entry
+    return Path(best.path) if best is not None else None
+
+
+def latest_execution_dir(runs_root: Path) -> Optional[Path]:
+    """Return the newest ``<runs_root>/<date>/<execution>`` directory, if any.
+
+    Older dates are only consulted when the newest date directory is empty.
+    """
+
+    if not runs_root.exists():
+        return None
+    with os.scandir(runs_root) as entries:
+        date_dirs = [entry for entry in entries if entry.is_dir()]
+    while date_dirs:
+        date_dir = max(date_dirs, key=lambda entry: entry.name)
+        exec_dir = latest_subdir(Path(date_dir.path))
+        if exec_dir is not None:
+            return exec_dir
+        date_dirs.remove(date_dir)
+    return None
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import subprocess
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -28,11 +29,25 @@ def run_git(args: List[str], cwd: Path) -> bool:
     return True
 
 
+_utc_day_cache: Tuple[int, str] = (-1, "")
+
+
+def _utc_day() -> str:
+    """Return today's UTC date as YYYYMMDD, formatting only when the day rolls over."""
+
+    global _utc_day_cache
+    epoch_day = int(time.time() // 86400)
+    if epoch_day != _utc_day_cache[0]:
+        day = datetime.fromtimestamp(epoch_day * 86400, tz=timezone.utc)
+        _utc_day_cache = (epoch_day, day.strftime("%Y%m%d"))
+    return _utc_day_cache[1]
+
+
 def branch_name_for_mission(
     mission: Mission, agent: str = "codex", date: str | None = None
 ) -> str:
     mission_id = mission.get("mission_id", "mission")
-    day = date or datetime.utcnow().strftime("%Y%m%d")
+    day = date or _utc_day()
     return f"night/{day}/{mission_id}-{agent}"
 
 
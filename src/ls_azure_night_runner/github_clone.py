@@ -2,14 +2,38 @@
 
 from __future__ import annotations
 
+import base64
 import os
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
+from .config import env_flag
+
 REPOS_TO_CLONE = ["ls-spec", "ls-backend", "ls-scheduler", "ls-devops"]
 
+# Resolved once so each clone skips the PATH lookup (None when git is missing).
+_GIT = shutil.which("git")
+
+# URL-scoped so the header is only ever sent to GitHub.
+_GITHUB_EXTRAHEADER_KEY = "http.https://github.com/.extraheader"
+
+
+def submodule_clone_args() -> List[str]:
+    """Return ``git clone`` args for submodules; opt-in via LS_NIGHT_CLONE_SUBMODULES.
+
+    When enabled, submodules are fetched shallowly, up to four at a time.
+    """
+
+    if not env_flag("LS_NIGHT_CLONE_SUBMODULES"):
+        return []
+    return ["--recurse-submodules", "--shallow-submodules", "--jobs", "4"]
+
 
+@lru_cache(maxsize=1)
 def get_github_token() -> str | None:
     """Return the GitHub token from the environment (if any)."""
 
@@ -20,27 +44,61 @@ def get_github_token() -> str | None:
     return token
 
 
-def _build_repo_url(repo: str, token: str | None) -> str:
-    base = f"github.com/leejad123/{repo}.git"
-    if token:
-        return f"https://{token}:x-oauth-basic@{base}"
-    return f"https://{base}"
+def _build_repo_url(repo: str) -> str:
+    return f"https://github.com/leejad123/{repo}.git"
 
 
-def clone_repo(repo: str, dest: Path) -> bool:
+def export_git_auth(token: str | None) -> None:
+    """Export the GitHub auth header so every child git process inherits it.
+
+    The Basic auth header goes into ``GIT_CONFIG_COUNT``/``GIT_CONFIG_KEY_n``/
+    ``GIT_CONFIG_VALUE_n`` in ``os.environ``, so it never shows up on argv
+    (process listings) or in any repo's ``.git/config``, and fetches/pushes from
+    any executor authenticate without extra plumbing. Calling it again updates
+    the exported header in place.
+    """
+
+    if not token:
+        return
+    basic = base64.b64encode(f"{token}:x-oauth-basic".encode("utf-8")).decode("ascii")
+    value = f"Authorization: Basic {basic}"
+    count = int(os.environ.get("GIT_CONFIG_COUNT") or 0)
+    for index in range(count):
+        if os.environ.get(f"GIT_CONFIG_KEY_{index}") == _GITHUB_EXTRAHEADER_KEY:
+            os.environ[f"GIT_CONFIG_VALUE_{index}"] = value
+            return
+    # Append after any GIT_CONFIG_* entries the environment already has.
+    os.environ[f"GIT_CONFIG_KEY_{count}"] = _GITHUB_EXTRAHEADER_KEY
+    os.environ[f"GIT_CONFIG_VALUE_{count}"] = value
+    os.environ["GIT_CONFIG_COUNT"] = str(count + 1)
+
+
+def clone_repo(repo: str, dest: Path, token: str | None) -> bool:
     """Clone the given repo into dest; return True on success."""
 
     if dest.exists():
         print(f"Repo {repo} already present at {dest}, skipping clone.")
         return True
 
-    token = get_github_token()
-    url = _build_repo_url(repo, token)
+    if _GIT is None:
+        # clone_all already warned once; don't fork just to hit FileNotFoundError.
+        return False
+
+    url = _build_repo_url(repo)
+    export_git_auth(token)
     dest.parent.mkdir(parents=True, exist_ok=True)
 
     print(f"Cloning {repo} into {dest}...")
     result = subprocess.run(
-        ["git", "clone", "--depth", "1", url, str(dest)],
+        [
+            _GIT,
+            "clone",
+            "--depth",
+            "1",
+            *submodule_clone_args(),
+            url,
+            str(dest),
+        ],
         capture_output=True,
         text=True,
         check=False,
@@ -55,6 +113,7 @@ def clone_repo(repo: str, dest: Path) -> bool:
     return False
 
 
+@lru_cache(maxsize=1)
 def _resolve_workspace_root() -> Path:
     preferred = Path("/workspace/repos")
     try:
@@ -73,10 +132,15 @@ def _resolve_workspace_root() -> Path:
 def clone_all() -> List[str]:
     """Clone all required repos and return the list that succeeded."""
 
+    if _GIT is None:
+        print("Warning: git executable not found on PATH; only existing repos are usable.")
+
     root = _resolve_workspace_root()
-    cloned: List[str] = []
-    for repo in REPOS_TO_CLONE:
-        dest = root / repo
-        if clone_repo(repo, dest):
-            cloned.append(repo)
-    return cloned
+    token = get_github_token()
+    # Clones are network-bound git subprocesses, so run them side by side.
+    with ThreadPoolExecutor(max_workers=min(len(REPOS_TO_CLONE), 4)) as pool:
+        futures = {
+            repo: pool.submit(clone_repo, repo, root / repo, token)
+            for repo in REPOS_TO_CLONE
+        }
+    return [repo for repo, future in futures.items() if future.result()]
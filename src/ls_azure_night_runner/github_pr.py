@@ -3,11 +3,29 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+# (connect, read): fail fast when GitHub is unreachable, keep a generous read window.
+_TIMEOUT = (5, 15)
 
+# One pooled session so repeated GitHub API calls reuse the TCP/TLS connection.
+# Retry's default allowed_methods excludes POST, so PR creation is never replayed.
+_RETRY = Retry(total=2, backoff_factor=0.5, status_forcelist=[502, 503, 504], raise_on_status=False)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_RETRY))
+
+# (owner, repo, head) -> (expiry on the monotonic clock, open PR payload)
+_EXISTING_PR_TTL_SECONDS = 60.0
+_EXISTING_PR_CACHE: Dict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]] = {}
+
+
+@lru_cache(maxsize=1)
 def get_github_token() -> Optional[str]:
     token = os.getenv("GITHUB_TOKEN")
     if not token:
@@ -25,12 +43,19 @@ def _headers(token: str) -> Dict[str, str]:
 
 
 def _existing_pr(owner: str, repo: str, head: str, token: str) -> Optional[Dict[str, Any]]:
+    key = (owner, repo, head)
+    cached = _EXISTING_PR_CACHE.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
     url = f"https://api.github.com/repos/{owner}/{repo}/pulls"
     params = {"head": f"{owner}:{head}", "state": "open"}
-    resp = requests.get(url, headers=_headers(token), params=params, timeout=15)
+    resp = _SESSION.get(url, headers=_headers(token), params=params, timeout=_TIMEOUT)
     if resp.status_code == 200:
         prs = resp.json()
         if prs:
+            # Only hits are cached; a miss is always re-checked against GitHub.
+            _EXISTING_PR_CACHE[key] = (time.monotonic() + _EXISTING_PR_TTL_SECONDS, prs[0])
             return prs[0]
     return None
 
@@ -42,9 +67,10 @@ def create_pr(owner: str, repo: str, head: str, base: str, title: str, body: str
 
     url = f"https://api.github.com/repos/{owner}/{repo}/pulls"
     payload = {"title": title, "head": head, "base": base, "body": body}
-    resp = requests.post(url, headers=_headers(token), json=payload, timeout=15)
+    resp = _SESSION.post(url, headers=_headers(token), json=payload, timeout=_TIMEOUT)
 
     if resp.status_code == 201:
+        _EXISTING_PR_CACHE.pop((owner, repo, head), None)
         pr = resp.json()
         return {
             "success": True,
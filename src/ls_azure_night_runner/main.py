@@ -4,17 +4,65 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List, Tuple
 
 from .config import PlannerConfig, get_spec_root
-from .github_clone import clone_all
+from .console import drain_stdout, line_atomic_stdout
+from .github_clone import _resolve_workspace_root, clone_all, export_git_auth, get_github_token
 from .git_sandbox import create_local_sandbox_branches
-from .missions import format_plan, load_missions, select_ready_missions
-from .dispatcher import run_mission_executor
+from .missions import Mission, format_plan, load_missions, select_ready_missions
+from .dispatcher import mission_repo_names, run_mission_executor
 from .results import make_run_id, write_mission_result
 from .spec_bootstrap import ensure_spec_repo
 
 
+def _run_missions_parallel(
+    missions: List[Mission], repos_root: Path, run_id: str
+) -> List[Any]:
+    """Run mission executors concurrently, returning results in mission order.
+
+    Each result is written to the run's JSONL log as soon as its mission finishes,
+    so a failing executor never loses results that already completed.
+    Missions that share a repo checkout still run one at a time: each task holds
+    the locks for all of its repos (taken in sorted order to avoid deadlock).
+    Executor output goes through a line-atomic stdout so log records stay whole.
+    """
+
+    # Per-run memo: each repo's execution run dir is resolved once for all missions.
+    execution_dirs: Dict[Path, Tuple[Path, str]] = {}
+
+    def _run_and_record(mission: Mission) -> Any:
+        exec_result = run_mission_executor(mission, repos_root, execution_dirs)
+        write_mission_result(run_id, exec_result)
+        return exec_result
+
+    if len(missions) <= 1:
+        return [_run_and_record(mission) for mission in missions]
+
+    repo_locks: Dict[str, threading.Lock] = {}
+    for mission in missions:
+        for name in mission_repo_names(mission):
+            repo_locks.setdefault(name, threading.Lock())
+
+    def _run(mission: Mission) -> Any:
+        locks = [repo_locks[name] for name in sorted(set(mission_repo_names(mission)))]
+        for lock in locks:
+            lock.acquire()
+        try:
+            return _run_and_record(mission)
+        finally:
+            drain_stdout()
+            for lock in reversed(locks):
+                lock.release()
+
+    with line_atomic_stdout(), ThreadPoolExecutor(max_workers=min(8, len(missions))) as pool:
+        futures = [pool.submit(_run, mission) for mission in missions]
+        return [future.result() for future in futures]
+
+
 def main() -> None:
     """Generate and print a dry-run Night Plan from local missions."""
 
@@ -30,6 +78,9 @@ def main() -> None:
             (path for path in candidates if path.exists()), candidates[-1]
         )
 
+    # Bootstrap git auth once: every child git process (clones, fetches, pushes,
+    # including external executors) inherits the GIT_CONFIG_* header from here.
+    export_git_auth(get_github_token())
     ensure_spec_repo(desired_spec_root)
 
     try:
@@ -46,16 +97,16 @@ def main() -> None:
     ready_missions = select_ready_missions(missions, config.max_missions)
     cloned_repos = clone_all()
     print(f"Cloned repos: {cloned_repos}")
-    repos_root = Path("/workspace/repos")
-    if not repos_root.exists():
-        repos_root = Path(__file__).resolve().parents[2] / "workspace" / "repos"
+    # Same (memoized) root clone_all just cloned into.
+    repos_root = _resolve_workspace_root()
     created = create_local_sandbox_branches(ready_missions, repos_root)
     print(f"Created sandbox branches (local only): {created}")
 
-    for mission in ready_missions:
-        exec_result = run_mission_executor(mission, repos_root)
+    # Executors are git/network bound, so missions overlap; results are logged as
+    # each one finishes and printed in mission order, keeping output deterministic.
+    exec_results = _run_missions_parallel(ready_missions, repos_root, run_id)
+    for mission, exec_result in zip(ready_missions, exec_results):
         print(f"Executor result for {mission.get('mission_id')}: {exec_result}")
-        write_mission_result(run_id, exec_result)
     plan_text = format_plan(ready_missions)
     print(plan_text)
 
@@ -2,21 +2,59 @@
 
 from __future__ import annotations
 
+import heapq
+import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List
 
 import yaml
 
+try:  # libyaml-backed parser when PyYAML was built with it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _SafeLoader
+
 Mission = Dict[str, object]
 
+# (priority, mission_id) of a ``(priority, mission_id, mission)`` ready entry.
+_READY_KEY = itemgetter(0, 1)
+
+
+def _load_mission_file(mission_path: Path) -> object:
+    return yaml.load(mission_path.read_bytes(), Loader=_SafeLoader) or {}
+
+
+def _list_mission_paths(missions_dir: Path) -> List[Path]:
+    try:
+        with os.scandir(missions_dir) as entries:
+            return sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith("NM-")
+                and entry.name.endswith(".yaml")
+                and entry.is_file()
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
 
 def load_missions(spec_root: Path) -> List[Mission]:
     """Load all mission YAML files from ls-spec."""
 
     missions_dir = spec_root / "ops" / "night_missions"
+    mission_paths = _list_mission_paths(missions_dir)
+
+    if len(mission_paths) > 1:
+        # Reads and parses overlap across threads; map() keeps the sorted order.
+        with ThreadPoolExecutor(max_workers=min(8, len(mission_paths))) as pool:
+            loaded = list(pool.map(_load_mission_file, mission_paths))
+    else:
+        loaded = [_load_mission_file(path) for path in mission_paths]
+
     missions: List[Mission] = []
-    for mission_path in sorted(missions_dir.glob("NM-*.yaml")):
-        mission_data = yaml.safe_load(mission_path.read_text()) or {}
+    for mission_path, mission_data in zip(mission_paths, loaded):
         if not isinstance(mission_data, dict):
             mission_data = {}
         mission_data.setdefault("mission_id", mission_path.stem)
@@ -40,8 +78,17 @@ def select_ready_missions(missions: List[Mission], max_missions: int) -> List[Mi
         mission_id = mission.get("mission_id") or ""
         ready.append((priority, mission_id, mission))
 
-    ready.sort(key=lambda item: (item[0], item[1]))
-    return [entry[2] for entry in ready[:max_missions]]
+    # Top-k selection: O(N log k) and stable, same result as sort-then-slice.
+    return [entry[2] for entry in heapq.nsmallest(max_missions, ready, key=_READY_KEY)]
+
+
+def _format_repos(repos: object) -> str:
+    if not isinstance(repos, list) or not repos:
+        return "no repos listed"
+    return ", ".join(
+        str(repo.get("name") or repo.get("repo") or "repo") if isinstance(repo, dict) else str(repo)
+        for repo in repos
+    )
 
 
 def format_plan(missions: List[Mission]) -> str:
@@ -53,23 +100,12 @@ def format_plan(missions: List[Mission]) -> str:
         return "\n".join(lines)
 
     for mission in missions:
-        mission_id = mission.get("mission_id", "UNKNOWN")
-        title = mission.get("title") or "Untitled mission"
-        priority_value = mission.get("priority")
-        priority = priority_value if isinstance(priority_value, int) else 50
-        repos = mission.get("repos")
-        if isinstance(repos, list) and repos:
-            repo_names = []
-            for repo in repos:
-                if isinstance(repo, dict):
-                    repo_names.append(str(repo.get("name") or repo.get("repo") or "repo"))
-                else:
-                    repo_names.append(str(repo))
-            repo_list = ", ".join(repo_names)
-        else:
-            repo_list = "no repos listed"
+        priority = mission.get("priority")
+        if not isinstance(priority, int):
+            priority = 50
         lines.append(
-            f"  - {mission_id} (priority={priority}) — {title} [{repo_list}]"
+            f"  - {mission.get('mission_id', 'UNKNOWN')} (priority={priority}) — "
+            f"{mission.get('title') or 'Untitled mission'} [{_format_repos(mission.get('repos'))}]"
         )
 
     return "\n".join(lines)
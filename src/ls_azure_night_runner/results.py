@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+import atexit
 import json
-from datetime import datetime
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, TextIO
+
+# Reused across writes so json.dumps doesn't rebuild an encoder per record.
+_RESULT_ENCODER = json.JSONEncoder()
+
+# One line-buffered append handle per run_id, kept open until interpreter exit.
+_OPEN_FILES: Dict[str, TextIO] = {}
+_OPEN_FILES_LOCK = threading.Lock()
 
 
 def get_results_root() -> Path:
@@ -20,14 +29,38 @@ def get_results_root() -> Path:
 
 
 def make_run_id() -> str:
-    return datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _utc_timestamp() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _close_result_files() -> None:
+    with _OPEN_FILES_LOCK:
+        for fh in _OPEN_FILES.values():
+            fh.close()
+        _OPEN_FILES.clear()
+
+
+atexit.register(_close_result_files)
+
+
+def _result_file(run_id: str) -> TextIO:
+    with _OPEN_FILES_LOCK:
+        fh = _OPEN_FILES.get(run_id)
+        if fh is None:
+            path = get_results_root() / f"mission_results_{run_id}.jsonl"
+            fh = path.open("a", buffering=1, encoding="utf-8")
+            _OPEN_FILES[run_id] = fh
+        return fh
 
 
 def write_mission_result(run_id: str, mission_result: Dict[str, Any]) -> None:
-    results_root = get_results_root()
-    path = results_root / f"mission_results_{run_id}.jsonl"
     enriched = dict(mission_result)
     enriched["run_id"] = run_id
-    enriched["timestamp"] = datetime.utcnow().isoformat() + "Z"
-    with path.open("a") as fh:
-        fh.write(json.dumps(enriched) + "\n")
+    enriched["timestamp"] = _utc_timestamp()
+    line = _RESULT_ENCODER.encode(enriched) + "\n"
+    fh = _result_file(run_id)
+    with _OPEN_FILES_LOCK:
+        fh.write(line)
@@ -4,18 +4,13 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Dict, List
+from typing import Dict, List, Mapping
 
+from .config import env_flag
 
-_TRUE_VALUES = {"1", "true", "yes", "on"}
 
-
-def _env_flag(name: str) -> bool:
-    return os.getenv(name, "").strip().lower() in _TRUE_VALUES
-
-
-def _has_value(name: str) -> bool:
-    value = os.getenv(name)
+def _has_value(env: Mapping[str, str], name: str) -> bool:
+    value = env.get(name)
     return bool(value and value.strip())
 
 
@@ -25,8 +20,8 @@ def log_night_runner_secret_status() -> Dict[str, object]:
     Returns the status dict.
     """
 
-    api_enabled = _env_flag("GROK_ENABLE_API")
-    has_key = _has_value("GROK_API_KEY")
+    api_enabled = env_flag("GROK_ENABLE_API")
+    has_key = _has_value(os.environ, "GROK_API_KEY")
 
     missing: List[str] = []
     # We record missing GROK_API_KEY even when the API flag is off to aid diagnostics,